@@ -13,12 +13,28 @@ v114: 3 programs per plan with periodization phases:
 Based on 1RM progression data from Oct 2024 to Dec 2025.
 """
 
+import bisect
+import functools
+import itertools
 import json
-import random
-from datetime import datetime, timedelta
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
-# Use deterministic seed for reproducible data
-random.seed(42)
+try:
+    import orjson  # Optional: much faster encoder for the large sets/instances files
+except ImportError:
+    orjson = None
+
+# App bundle data files this script rewrites
+DATA_DIR = "/Users/bobbytulsiani/Desktop/medina/Resources/Data"
+
+# Write set records for scheduled (future) instances. They only carry targets and
+# "scheduled" filler, but the app resolves instance.setIds against sets.json during
+# workout execution, so only turn this off for data that is never executed.
+EMIT_SCHEDULED_SETS = True
 
 # 1RM progression data (at START of each quarter)
 QUARTERS = [
@@ -29,6 +45,15 @@ QUARTERS = [
     {"name": "Q4 2025", "start": "2025-10-01", "end": "2025-12-31", "bodyweight": 150},
 ]
 
+# Quarter (start, end) dates parsed once at import; hot paths compare against these
+QUARTER_BOUNDS = [
+    (date.fromisoformat(q["start"]), date.fromisoformat(q["end"]))
+    for q in QUARTERS
+]
+
+# Sorted quarter start ordinals for bisecting a date to its quarter index
+_QSTART_ORDS = [start.toordinal() for start, _ in QUARTER_BOUNDS]
+
 # 1RM values at start of each quarter
 ONE_RM_PROGRESSION = {
     "barbell_back_squat": [170, 180, 215, 220, 195],
@@ -60,6 +85,23 @@ FULL_BODY_EXERCISES = [
     ["barbell_curl", "pendlay_row"],
 ]
 
+# Exercise picks repeat every LCM(group sizes) days, so precompute each rotation.
+# Indexed by date ordinal % _ROTATION_PERIOD; the lists are shared, don't mutate them.
+_ROTATION_PERIOD = math.lcm(*(len(group) for group in FULL_BODY_EXERCISES))
+_STRENGTH_ROTATIONS = [
+    [group[(day_num + i) % len(group)] for i, group in enumerate(FULL_BODY_EXERCISES)]
+    for day_num in range(_ROTATION_PERIOD)
+]
+
+# Weekly split as (days after Monday, workout type, variant): MWF strength, T/Th cardio, weekends off
+WEEKLY_SPLIT = [
+    (0, "strength", "A"),
+    (1, "cardio", "A"),
+    (2, "strength", "B"),
+    (3, "cardio", "B"),
+    (4, "strength", "C"),
+]
+
 # Protocol templates - IDs must match protocol_configs.json
 PROTOCOLS = {
     "strength_3x5_moderate": {"reps": [5, 5, 5], "intensity": 0.75, "rest": 180},
@@ -69,6 +111,45 @@ PROTOCOLS = {
     "strength_3x12_light": {"reps": [12, 12, 12], "intensity": 0.55, "rest": 60},
 }
 
+# protocolVariantIds keys, by exercise position
+_POSITION_KEYS = [str(ex_idx) for ex_idx in range(len(FULL_BODY_EXERCISES))]
+
+# Cardio workouts log a single set
+CARDIO_PROTOCOL = {"reps": [1], "intensity": 0.5, "rest": 0}
+
+# Constant per-set string pieces, so set IDs and recorded timestamps are a single
+# concatenation: set ID = instance_id + _SET_ID_SUFFIXES[set_num], recordedDate =
+# iso_date + _RECORDED_TIMES[exercise position][set_num]
+_MAX_SETS = max(len(protocol["reps"]) for protocol in PROTOCOLS.values())
+_SET_ID_SUFFIXES = [f"_s{set_num + 1}" for set_num in range(_MAX_SETS)]
+_RECORDED_TIMES = [
+    [f"T{10 + ex_idx}:{30 + set_num * 3}:00Z" for set_num in range(_MAX_SETS)]
+    for ex_idx in range(len(FULL_BODY_EXERCISES))
+]
+
+
+def build_set_layout(reps):
+    """Precompute the parts of a protocol's sets that never vary between instances.
+
+    Returns: (reps, set_count, set ID suffixes, set numbers, all-None column,
+              all-"skipped" column, all-"scheduled" column)
+    """
+    set_count = len(reps)
+    return (
+        tuple(reps),
+        set_count,
+        _SET_ID_SUFFIXES[:set_count],
+        tuple(range(1, set_count + 1)),
+        (None,) * set_count,
+        ("skipped",) * set_count,
+        ("scheduled",) * set_count,
+    )
+
+
+# Set layouts specialized per protocol, so the set loop never inspects protocol dicts
+SET_LAYOUTS = {protocol_id: build_set_layout(protocol["reps"]) for protocol_id, protocol in PROTOCOLS.items()}
+CARDIO_SET_LAYOUT = build_set_layout(CARDIO_PROTOCOL["reps"])
+
 # v114: Periodization phases for each quarterly plan
 # TrainingFocus enum values: foundation, development, peak, maintenance, deload
 # Protocol IDs must match protocol_configs.json
@@ -100,63 +181,106 @@ PHASES = [
 ]
 
 
-def get_1rm_for_date(exercise_id, workout_date):
-    """Get the 1RM value for an exercise at a given date."""
+@functools.lru_cache(maxsize=None)
+def get_1rm_for_quarter(exercise_id, quarter_idx):
+    """Get the 1RM value for an exercise in a quarter (index into QUARTERS, -1 if before them).
+
+    Cached: a full run only sees ~60 distinct (exercise, quarter) pairs.
+    """
     if exercise_id not in ONE_RM_PROGRESSION:
         return 100  # Default for unknown exercises
 
     values = ONE_RM_PROGRESSION[exercise_id]
+    if quarter_idx < 0:
+        return values[-1]  # Default to latest
 
-    # Find which quarter this date falls into
-    for i, q in enumerate(QUARTERS):
-        start = datetime.strptime(q["start"], "%Y-%m-%d").date()
-        end = datetime.strptime(q["end"], "%Y-%m-%d").date()
-        if start <= workout_date <= end:
-            return values[i] if i < len(values) else values[-1]
+    return values[quarter_idx] if quarter_idx < len(values) else values[-1]
+
+
+def get_1rm_for_date(exercise_id, workout_date):
+    """Get the 1RM value for an exercise at a given date."""
+    # Find which quarter this date falls into (quarters are contiguous)
+    quarter_idx = bisect.bisect_right(_QSTART_ORDS, workout_date.toordinal()) - 1
+    return get_1rm_for_quarter(exercise_id, quarter_idx)
+
+
+# Set outcome distribution in percent (hit / exceeded / struggled / weight_drop / skipped)
+SET_OUTCOME_WEIGHTS = [
+    ("hit", 60),
+    ("exceeded", 15),
+    ("struggled", 15),
+    ("weight_drop", 5),
+    ("skipped", 5),
+]
 
-    return values[-1]  # Default to latest
+# Cumulative upper bounds of SET_OUTCOME_WEIGHTS, in the same order: (60, 75, 90, 95, 100)
+_OUTCOME_BOUNDS = tuple(itertools.accumulate(weight for _, weight in SET_OUTCOME_WEIGHTS))
 
 
-def generate_actual_performance(target_weight, target_reps, workout_date, exercise_num):
-    """Generate realistic actual performance based on target.
+# Independent random streams for seeded_bits
+SEED_STREAM_SET = 0
+SEED_STREAM_SKIP_WORKOUT = 1
+SEED_STREAM_SKIP_EXERCISE = 2
 
-    Returns: (actual_weight, actual_reps, completion_status)
+_MASK64 = (1 << 64) - 1
+
+
+def seeded_bits(day_ordinal, stream, index=0):
+    """Deterministic 64-bit value for (date ordinal, stream, position).
+
+    Packs the small integer inputs into one word and scrambles it with the
+    splitmix64 finalizer: no string formatting or hashing, stable across runs.
     """
-    # Use workout date + exercise position for deterministic randomness
-    seed_val = hash(f"{workout_date}_{exercise_num}")
-    random.seed(seed_val)
-
-    outcome = random.choices(
-        ["hit", "exceeded", "struggled", "weight_drop", "skipped"],
-        weights=[60, 15, 15, 5, 5]
-    )[0]
-
-    if outcome == "hit":
-        return target_weight, target_reps, "completed"
-    elif outcome == "exceeded":
-        extra_reps = random.randint(1, 3)
-        return target_weight, target_reps + extra_reps, "completed"
-    elif outcome == "struggled":
-        max_fewer = max(1, min(2, target_reps - 1))
-        fewer_reps = random.randint(1, max_fewer) if max_fewer > 0 else 1
-        return target_weight, max(1, target_reps - fewer_reps), "completed"
-    elif outcome == "weight_drop":
-        # Dropped weight by 10%, hit target reps
-        return round(target_weight * 0.9, 1), target_reps, "completed"
-    else:
-        return None, None, "skipped"
+    x = ((day_ordinal << 16) | (stream << 8) | index) + 0x9E3779B97F4A7C15
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def generate_set_performances(target_weight, target_reps_list, workout_date, exercise_idx):
+    """Generate realistic actual performance for every set of an exercise instance.
+
+    Sampling is done inline for the whole instance rather than through a per-set
+    helper, since this runs for every completed exercise.
+
+    Returns: list of (actual_weight, actual_reps, completion_status), one per set
+    """
+    dropped_weight = round(target_weight * 0.9, 1)  # Dropped weight by 10%, hit target reps
+    day_ordinal = workout_date.toordinal()
+    hit_bound, exceeded_bound, struggled_bound, weight_drop_bound, _ = _OUTCOME_BOUNDS
+    performances = []
+
+    for set_num, target_reps in enumerate(target_reps_list):
+        # Use workout date + exercise/set position for deterministic randomness
+        bits = seeded_bits(day_ordinal, SEED_STREAM_SET, exercise_idx * 10 + set_num)
+        roll, bits = bits % 100, bits // 100
+
+        # Outcome branches follow SET_OUTCOME_WEIGHTS order
+        if roll < hit_bound:
+            performances.append((target_weight, target_reps, "completed"))
+        elif roll < exceeded_bound:
+            extra_reps = 1 + bits % 3
+            performances.append((target_weight, target_reps + extra_reps, "completed"))
+        elif roll < struggled_bound:
+            max_fewer = max(1, min(2, target_reps - 1))
+            fewer_reps = 1 + bits % max_fewer
+            performances.append((target_weight, max(1, target_reps - fewer_reps), "completed"))
+        elif roll < weight_drop_bound:
+            performances.append((dropped_weight, target_reps, "completed"))
+        else:
+            performances.append((None, None, "skipped"))
+
+    return performances
 
 
 def should_skip_workout(workout_date):
     """Determine if entire workout should be skipped (~10% rate)."""
-    random.seed(hash(str(workout_date)))
-    return random.random() < 0.10
+    return seeded_bits(workout_date.toordinal(), SEED_STREAM_SKIP_WORKOUT) % 100 < 10
 
 
 def should_skip_exercise(workout_date, exercise_num):
     """Determine if an exercise should be skipped (~5% rate)."""
-    random.seed(hash(f"{workout_date}_ex_{exercise_num}"))
-    return random.random() < 0.05
+    return seeded_bits(workout_date.toordinal(), SEED_STREAM_SKIP_EXERCISE, exercise_num) % 100 < 5
 
 
 def select_exercises_for_workout(workout_date, workout_type):
@@ -164,15 +288,8 @@ def select_exercises_for_workout(workout_date, workout_type):
     if workout_type == "cardio":
         return ["treadmill_run"]  # Single cardio exercise
 
-    exercises = []
-    day_num = workout_date.toordinal()  # Use date for alternation
-
-    for i, group in enumerate(FULL_BODY_EXERCISES):
-        # Rotate through options based on day
-        choice = group[(day_num + i) % len(group)]
-        exercises.append(choice)
-
-    return exercises
+    # Use date for alternation, rotating through each group's options
+    return _STRENGTH_ROTATIONS[workout_date.toordinal() % _ROTATION_PERIOD]
 
 
 def generate_plans():
@@ -221,11 +338,9 @@ def generate_programs():
     programs = {}
     today = datetime.now().date()
 
-    for i, q in enumerate(QUARTERS):
+    for i, (q, (quarter_start, quarter_end)) in enumerate(zip(QUARTERS, QUARTER_BOUNDS)):
         quarter_id = q["name"].lower().replace(" ", "_")
         plan_id = f"plan_bobby_{quarter_id}"
-        quarter_start = datetime.strptime(q["start"], "%Y-%m-%d").date()
-        quarter_end = datetime.strptime(q["end"], "%Y-%m-%d").date()
 
         for phase_idx, phase in enumerate(PHASES):
             prog_id = f"prog_bobby_{quarter_id}_{phase['name'].lower()}"
@@ -297,6 +412,24 @@ def get_intensity_for_week(week_num, phase):
     return intensity_start + (intensity_end - intensity_start) * progress
 
 
+def build_week_table():
+    """Precompute (phase_idx, phase, intensity, protocol_id) for every week a quarter can span.
+
+    Quarters start counting at their first Monday, so the longest quarter spans
+    at most days // 7 + 1 weeks; weeks past 12 stay in the last phase.
+    """
+    max_weeks = max((end - start).days for start, end in QUARTER_BOUNDS) // 7 + 1
+    table = []
+    for week_num in range(1, max_weeks + 1):
+        phase_idx, phase = get_phase_for_week(week_num)
+        table.append((phase_idx, phase, get_intensity_for_week(week_num, phase), phase["protocol"]))
+    return table
+
+
+# Indexed by week_num - 1
+WEEK_TABLE = build_week_table()
+
+
 def generate_workouts_with_data():
     """Generate workouts, instances, and sets with realistic performance data.
 
@@ -307,7 +440,6 @@ def generate_workouts_with_data():
     """
     workouts = []
     instances = {}
-    sets = {}
     today = datetime.now().date()
 
     total_stats = {
@@ -319,170 +451,183 @@ def generate_workouts_with_data():
         "sets_skipped": 0,
     }
 
-    for i, q in enumerate(QUARTERS):
+    # Set fields are collected column-wise per instance and only turned into
+    # per-set dicts once, after generation
+    set_col_ids = []
+    set_col_instance_ids = []
+    set_col_numbers = []
+    set_col_target_weights = []
+    set_col_target_reps = []
+    set_col_actual_weights = []
+    set_col_actual_reps = []
+    set_col_completions = []
+    set_col_recorded_dates = []
+
+    for q, (start_date, end_date) in zip(QUARTERS, QUARTER_BOUNDS):
         quarter_id = q["name"].lower().replace(" ", "_")
 
-        start_date = datetime.strptime(q["start"], "%Y-%m-%d").date()
-        end_date = datetime.strptime(q["end"], "%Y-%m-%d").date()
-
-        week_num = 1
-        current_date = start_date
-
-        # Find first Monday
-        while current_date.weekday() != 0:
-            current_date += timedelta(days=1)
+        # Weeks run Monday-Friday starting from the quarter's first Monday
+        first_monday = start_date + timedelta(days=(7 - start_date.weekday()) % 7)
+        num_weeks = (end_date - first_monday).days // 7 + 1
 
-        while current_date <= end_date:
-            day_of_week = current_date.weekday()
-            date_str = current_date.strftime("%Y%m%d")
-            is_past = current_date < today
+        for week_num in range(1, num_weeks + 1):
+            monday = first_monday + timedelta(weeks=week_num - 1)
 
             # v114: Get the correct program based on week number
-            phase_idx, phase = get_phase_for_week(week_num)
+            phase_idx, phase, week_intensity, phase_protocol = WEEK_TABLE[week_num - 1]
             phase_name = phase["name"].lower()
             prog_id = f"prog_bobby_{quarter_id}_{phase_name}"
-            phase_protocol = phase["protocol"]
-
-            # MWF = strength (Mon=0, Wed=2, Fri=4)
-            if day_of_week in [0, 2, 4]:
-                workout_id = f"bobby_{date_str}_strength"
-                workout_type = "strength"
-                split_day = "full_body"
-                variant = "A" if day_of_week == 0 else "B" if day_of_week == 2 else "C"
-                workout_name = f"Week {week_num} Full Body {variant}"
-                # v114: Use phase-appropriate protocol
-                protocol_id = phase_protocol
-
-            # T/Th = cardio (Tue=1, Thu=3)
-            elif day_of_week in [1, 3]:
-                workout_id = f"bobby_{date_str}_cardio"
-                workout_type = "cardio"
-                split_day = "not_applicable"
-                variant = "A" if day_of_week == 1 else "B"
-                workout_name = f"Week {week_num} Cardio {variant}"
-                protocol_id = "cardio_30min_steady"
-            else:
-                # Increment week on Sunday
-                if day_of_week == 6:
-                    week_num += 1
-                current_date += timedelta(days=1)
-                continue
-
-            # Check if workout should be skipped (only for past workouts)
-            workout_skipped = is_past and should_skip_workout(current_date)
-
-            if workout_skipped:
-                workout_status = "skipped"
-                total_stats["workouts_skipped"] += 1
-            elif is_past:
-                workout_status = "completed"
-                total_stats["workouts_completed"] += 1
-            else:
-                workout_status = "scheduled"
-
-            # Select exercises for this workout
-            exercise_ids = select_exercises_for_workout(current_date, workout_type)
-
-            workout_data = {
-                "id": workout_id,
-                "programId": prog_id,
-                "name": workout_name,
-                "scheduledDate": f"{current_date.isoformat()}T10:00:00Z",
-                "type": workout_type,
-                "splitDay": split_day,
-                "status": workout_status,
-                "completedDate": f"{current_date.isoformat()}T11:30:00Z" if workout_status == "completed" else None,
-                "exerciseIds": exercise_ids if not workout_skipped else [],
-                "protocolVariantIds": {},
-            }
-
-            # Generate instances and sets (only for non-skipped past workouts or future workouts)
-            if not workout_skipped:
-                for ex_idx, exercise_id in enumerate(exercise_ids):
-                    instance_id = f"{workout_id}_ex{ex_idx}"
-
-                    # Check if this exercise should be skipped
-                    exercise_skipped = is_past and should_skip_exercise(current_date, ex_idx)
-
-                    if exercise_skipped:
-                        instance_status = "skipped"
-                        total_stats["exercises_skipped"] += 1
-                    elif is_past:
-                        instance_status = "completed"
-                        total_stats["exercises_completed"] += 1
-                    else:
-                        instance_status = "scheduled"
-
-                    # Get protocol details
-                    if workout_type == "cardio":
-                        protocol = {"reps": [1], "intensity": 0.5, "rest": 0}
-                        protocol_id = "cardio_30min_steady"
-                        phase_intensity = 0.5
-                    else:
-                        protocol = PROTOCOLS.get(protocol_id, PROTOCOLS["strength_3x5_moderate"])
-                        # v114: Use phase-specific intensity based on week
-                        phase_intensity = get_intensity_for_week(week_num, phase)
-
-                    # Get 1RM for this exercise at this date
-                    one_rm = get_1rm_for_date(exercise_id, current_date)
-                    # v114: Use phase intensity instead of protocol default
-                    target_weight = round(one_rm * phase_intensity, 1)
-
-                    # Generate set IDs
-                    set_ids = []
-                    for set_num in range(len(protocol["reps"])):
-                        set_id = f"{instance_id}_s{set_num + 1}"
-                        set_ids.append(set_id)
-
-                        target_reps = protocol["reps"][set_num]
-
-                        # Generate actual performance (only for past, non-skipped)
-                        if is_past and instance_status == "completed":
-                            actual_weight, actual_reps, set_status = generate_actual_performance(
-                                target_weight, target_reps, current_date, ex_idx * 10 + set_num
-                            )
-                            if set_status == "skipped":
-                                total_stats["sets_skipped"] += 1
-                            else:
-                                total_stats["sets_completed"] += 1
-                        elif is_past and instance_status == "skipped":
-                            actual_weight, actual_reps, set_status = None, None, "skipped"
-                            total_stats["sets_skipped"] += 1
+            strength_layout = SET_LAYOUTS.get(phase_protocol, SET_LAYOUTS["strength_3x5_moderate"])
+
+            for day_offset, workout_type, variant in WEEKLY_SPLIT:
+                current_date = monday + timedelta(days=day_offset)
+                if current_date > end_date:
+                    break
+
+                iso_date = current_date.isoformat()
+                date_str = iso_date.replace("-", "")
+                is_past = current_date < today
+
+                if workout_type == "strength":
+                    workout_id = f"bobby_{date_str}_strength"
+                    split_day = "full_body"
+                    workout_name = f"Week {week_num} Full Body {variant}"
+                    # v114: Use phase-appropriate protocol and week-specific intensity
+                    protocol_id = phase_protocol
+                    set_layout = strength_layout
+                    phase_intensity = week_intensity
+                else:
+                    workout_id = f"bobby_{date_str}_cardio"
+                    split_day = "not_applicable"
+                    workout_name = f"Week {week_num} Cardio {variant}"
+                    protocol_id = "cardio_30min_steady"
+                    set_layout = CARDIO_SET_LAYOUT
+                    phase_intensity = 0.5
+
+                reps, set_count, set_id_suffixes, set_numbers, none_column, skipped_column, scheduled_column = set_layout
+                has_target_weight = workout_type == "strength"
+
+                # Check if workout should be skipped (only for past workouts)
+                workout_skipped = is_past and should_skip_workout(current_date)
+
+                if workout_skipped:
+                    workout_status = "skipped"
+                    total_stats["workouts_skipped"] += 1
+                elif is_past:
+                    workout_status = "completed"
+                    total_stats["workouts_completed"] += 1
+                else:
+                    workout_status = "scheduled"
+
+                # Select exercises for this workout
+                exercise_ids = select_exercises_for_workout(current_date, workout_type)
+
+                workout_data = {
+                    "id": workout_id,
+                    "programId": prog_id,
+                    "name": workout_name,
+                    "scheduledDate": f"{iso_date}T10:00:00Z",
+                    "type": workout_type,
+                    "splitDay": split_day,
+                    "status": workout_status,
+                    "completedDate": f"{iso_date}T11:30:00Z" if workout_status == "completed" else None,
+                    "exerciseIds": exercise_ids if not workout_skipped else [],
+                    # Every exercise in a workout uses the workout's protocol
+                    "protocolVariantIds": {} if workout_skipped else dict.fromkeys(_POSITION_KEYS[:len(exercise_ids)], protocol_id),
+                }
+
+                # Generate instances and sets (only for non-skipped past workouts or future workouts)
+                if not workout_skipped:
+                    for ex_idx, exercise_id in enumerate(exercise_ids):
+                        instance_id = f"{workout_id}_ex{ex_idx}"
+
+                        # Check if this exercise should be skipped
+                        exercise_skipped = is_past and should_skip_exercise(current_date, ex_idx)
+
+                        if exercise_skipped:
+                            instance_status = "skipped"
+                            total_stats["exercises_skipped"] += 1
+                        elif is_past:
+                            instance_status = "completed"
+                            total_stats["exercises_completed"] += 1
                         else:
-                            actual_weight, actual_reps, set_status = None, None, "scheduled"
-
-                        sets[set_id] = {
-                            "id": set_id,
-                            "exerciseInstanceId": instance_id,
-                            "setNumber": set_num + 1,
-                            "targetWeight": target_weight if workout_type == "strength" else None,
-                            "targetReps": target_reps,
-                            "actualWeight": actual_weight,
-                            "actualReps": actual_reps,
-                            "completion": set_status,
-                            "recordedDate": f"{current_date.isoformat()}T{10 + ex_idx}:{30 + set_num * 3}:00Z" if set_status == "completed" else None,
+                            instance_status = "scheduled"
+
+                        # Get 1RM for this exercise at this date
+                        one_rm = get_1rm_for_date(exercise_id, current_date)
+                        # v114: Use phase intensity instead of protocol default
+                        target_weight = round(one_rm * phase_intensity, 1)
+
+                        set_ids = [instance_id + suffix for suffix in set_id_suffixes]
+
+                        # Scheduled sets are pure filler; optionally leave them out (IDs are still listed)
+                        emit_sets = EMIT_SCHEDULED_SETS or instance_status != "scheduled"
+
+                        # Resolve each set column for the instance, then append them all at once
+                        if instance_status == "completed":
+                            performances = generate_set_performances(target_weight, reps, current_date, ex_idx)
+                            actual_weights, actual_reps, set_statuses = zip(*performances)
+                            skipped_sets = set_statuses.count("skipped")
+                            total_stats["sets_skipped"] += skipped_sets
+                            total_stats["sets_completed"] += set_count - skipped_sets
+
+                            recorded_times = _RECORDED_TIMES[ex_idx]
+                            recorded_dates = [
+                                iso_date + recorded_times[set_num] if set_status == "completed" else None
+                                for set_num, set_status in enumerate(set_statuses)
+                            ]
+                        elif instance_status == "skipped":
+                            actual_weights = actual_reps = recorded_dates = none_column
+                            set_statuses = skipped_column
+                            total_stats["sets_skipped"] += set_count
+                        else:
+                            actual_weights = actual_reps = recorded_dates = none_column
+                            set_statuses = scheduled_column
+
+                        if emit_sets:
+                            set_col_ids.extend(set_ids)
+                            set_col_instance_ids.extend([instance_id] * set_count)
+                            set_col_numbers.extend(set_numbers)
+                            set_col_target_weights.extend([target_weight] * set_count if has_target_weight else none_column)
+                            set_col_target_reps.extend(reps)
+                            set_col_actual_weights.extend(actual_weights)
+                            set_col_actual_reps.extend(actual_reps)
+                            set_col_completions.extend(set_statuses)
+                            set_col_recorded_dates.extend(recorded_dates)
+
+                        instances[instance_id] = {
+                            "id": instance_id,
+                            "exerciseId": exercise_id,
+                            "workoutId": workout_id,
+                            "protocolVariantId": protocol_id,
+                            "setIds": set_ids,
+                            "status": instance_status,
+                            "orderIndex": ex_idx,
                         }
 
-                    # Add protocol variant ID to workout
-                    workout_data["protocolVariantIds"][str(ex_idx)] = protocol_id
-
-                    instances[instance_id] = {
-                        "id": instance_id,
-                        "exerciseId": exercise_id,
-                        "workoutId": workout_id,
-                        "protocolVariantId": protocol_id,
-                        "setIds": set_ids,
-                        "status": instance_status,
-                        "orderIndex": ex_idx,
-                    }
-
-            workouts.append(workout_data)
-
-            # Increment week on Sunday
-            if day_of_week == 6:
-                week_num += 1
-
-            current_date += timedelta(days=1)
+                workouts.append(workout_data)
+
+    # A constant-key dict literal reuses one key tuple for every set and beats
+    # copying a template dict or dict(zip(fields, row))
+    set_rows = zip(
+        set_col_ids, set_col_instance_ids, set_col_numbers, set_col_target_weights, set_col_target_reps,
+        set_col_actual_weights, set_col_actual_reps, set_col_completions, set_col_recorded_dates,
+    )
+    sets = {
+        set_id: {
+            "id": set_id,
+            "exerciseInstanceId": instance_id,
+            "setNumber": set_number,
+            "targetWeight": target_weight,
+            "targetReps": target_reps,
+            "actualWeight": actual_weight,
+            "actualReps": actual_reps,
+            "completion": completion,
+            "recordedDate": recorded_date,
+        }
+        for (set_id, instance_id, set_number, target_weight, target_reps,
+             actual_weight, actual_reps, completion, recorded_date) in set_rows
+    }
 
     return workouts, instances, sets, total_stats
 
@@ -516,6 +661,46 @@ def generate_targets():
     return targets
 
 
+def write_json(path, data):
+    """Write data as 2-space indented JSON, using orjson when it's installed.
+
+    The whole document is encoded up front and written with a single write_bytes call.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(data, indent=2).encode()
+    Path(path).write_bytes(encoded)
+
+
+def merge_json_file(path, new_entries, stale_prefix=None):
+    """Replace generated entries in a data file, keeping everything else.
+
+    Dict files are keyed by ID; list files (workouts.json) hold objects with an "id".
+    Stale entries are dropped in place instead of copying the whole file, and the
+    result goes to a temp file that is swapped in, so a failed run can't truncate it.
+
+    Returns: total entry count after the merge
+    """
+    with open(path, "r") as f:
+        existing = json.load(f)
+
+    if isinstance(existing, list):
+        if stale_prefix:
+            existing[:] = [e for e in existing if not e["id"].startswith(stale_prefix)]
+        existing.extend(new_entries)
+    else:
+        if stale_prefix:
+            for key in [k for k in existing if k.startswith(stale_prefix)]:
+                del existing[key]
+        existing.update(new_entries)
+
+    tmp_path = f"{path}.tmp"
+    write_json(tmp_path, existing)
+    os.replace(tmp_path, path)
+    return len(existing)
+
+
 def main():
     print("=== v114: Generating Rich Historical Data for Bobby ===\n")
     print("Periodization: 3 programs per plan (Accumulation → Intensification → Realization)\n")
@@ -541,59 +726,24 @@ def main():
     targets = generate_targets()
     print(f"\nGenerated {len(targets)} target entries with history")
 
-    # Save plans
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/plans.json", "r") as f:
-        existing_plans = json.load(f)
-    existing_plans = {k: v for k, v in existing_plans.items() if not k.startswith("plan_bobby")}
-    existing_plans.update(plans)
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/plans.json", "w") as f:
-        json.dump(existing_plans, f, indent=2)
-    print("\nUpdated plans.json")
-
-    # Save programs
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/programs.json", "r") as f:
-        existing_programs = json.load(f)
-    existing_programs = {k: v for k, v in existing_programs.items() if not k.startswith("prog_bobby")}
-    existing_programs.update(programs)
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/programs.json", "w") as f:
-        json.dump(existing_programs, f, indent=2)
-    print("Updated programs.json")
-
-    # Save workouts
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/workouts.json", "r") as f:
-        existing_workouts = json.load(f)
-    existing_workouts = [w for w in existing_workouts if not w["id"].startswith("bobby_")]
-    existing_workouts.extend(workouts)
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/workouts.json", "w") as f:
-        json.dump(existing_workouts, f, indent=2)
-    print(f"Updated workouts.json ({len(existing_workouts)} total)")
-
-    # Save instances
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/instances.json", "r") as f:
-        existing_instances = json.load(f)
-    existing_instances = {k: v for k, v in existing_instances.items() if not k.startswith("bobby_")}
-    existing_instances.update(instances)
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/instances.json", "w") as f:
-        json.dump(existing_instances, f, indent=2)
-    print(f"Updated instances.json ({len(existing_instances)} total)")
-
-    # Save sets
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/sets.json", "r") as f:
-        existing_sets = json.load(f)
-    existing_sets = {k: v for k, v in existing_sets.items() if not k.startswith("bobby_")}
-    existing_sets.update(sets)
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/sets.json", "w") as f:
-        json.dump(existing_sets, f, indent=2)
-    print(f"Updated sets.json ({len(existing_sets)} total)")
-
-    # Save targets
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/targets.json", "r") as f:
-        existing_targets = json.load(f)
-    for target_id, target_data in targets.items():
-        existing_targets[target_id] = target_data
-    with open("/Users/bobbytulsiani/Desktop/medina/Resources/Data/targets.json", "w") as f:
-        json.dump(existing_targets, f, indent=2)
-    print("Updated targets.json")
+    # Save data files (each merge touches its own file, so their I/O can overlap)
+    merges = [
+        ("plans.json", plans, "plan_bobby"),
+        ("programs.json", programs, "prog_bobby"),
+        ("workouts.json", workouts, "bobby_"),
+        ("instances.json", instances, "bobby_"),
+        ("sets.json", sets, "bobby_"),
+        ("targets.json", targets, None),
+    ]
+    with ThreadPoolExecutor(max_workers=len(merges)) as executor:
+        futures = [
+            executor.submit(merge_json_file, f"{DATA_DIR}/{filename}", entries, stale_prefix)
+            for filename, entries, stale_prefix in merges
+        ]
+
+    print()
+    for (filename, _, _), future in zip(merges, futures):
+        print(f"Updated {filename} ({future.result()} total)")
 
     print("\n=== Summary ===")
     print("Plans: Q4 2024, Q1-Q4 2025 (5 total)")
@@ -8,17 +8,30 @@ Creates class instances from October 2025 through December 2025 with:
 - Bobby's booking history
 - Varied capacity/booking patterns
 
-Usage: python3 Scripts/generate_class_instances.py
+Usage: python3 Scripts/generate_class_instances.py [--pretty]
+
+Output is compact JSON by default; pass --pretty for 2-space indented files.
 """
 
+import argparse
 import json
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import date, datetime
 from pathlib import Path
 import random
 
+try:
+    import orjson  # Optional: much faster encoder for the output files
+except ImportError:
+    orjson = None
+
 # Seed for reproducibility
 random.seed(42)
 
+# All draws go through the seeded generator's C-level random(); uniform() and
+# randint() add Python-level call layers on top of it for every instance
+_random = random.random
+
 # Load gym classes
 GYM_CLASSES_PATH = Path(__file__).parent.parent / "Resources/Data/gym_classes.json"
 OUTPUT_INSTANCES_PATH = Path(__file__).parent.parent / "Resources/Data/class_instances.json"
@@ -99,49 +112,75 @@ WEEKLY_SCHEDULE = {
 }
 
 # Bobby's favorite classes (more likely to book)
-BOBBY_FAVORITES = [
+BOBBY_FAVORITES = frozenset({
     "class_full_body_burn_cellar",
     "class_red_light_district",
     "class_build_burn_hiit",
     "class_sweat_lab",
-]
+})
 
-def generate_instance_id(class_id: str, dt: datetime) -> str:
-    """Generate a unique instance ID."""
-    prefix = class_id.replace("class_", "")[:12]
-    date_str = dt.strftime("%Y%m%d_%H%M")
-    return f"instance_{prefix}_{date_str}"
+# Booking rate ranges (low, high): past classes were attended; future classes
+# fill by timing. Favorites get POPULAR_RATE_BOOST on top, capped at 100%.
+PAST_BOOKING_RATE = (0.6, 0.95)
+WEEKEND_BOOKING_RATE = (0.5, 0.85)
+MORNING_BOOKING_RATE = (0.4, 0.8)
+DEFAULT_BOOKING_RATE = (0.3, 0.7)
+POPULAR_RATE_BOOST = 0.15
 
-def generate_booking_id(member_id: str, class_id: str, dt: datetime) -> str:
-    """Generate a unique booking ID."""
-    prefix = class_id.replace("class_", "")[:10]
-    date_str = dt.strftime("%Y%m%d")
-    return f"booking_{member_id}_{prefix}_{date_str}"
+# Class ID prefixes used in instance/booking IDs, computed once per class
+INSTANCE_PREFIX = {cid: cid.replace("class_", "")[:12] for cid in gym_classes}
+BOOKING_PREFIX = {cid: cid.replace("class_", "")[:10] for cid in gym_classes}
 
-def get_booking_pattern(dt: datetime, class_id: str, gym_class: dict) -> tuple:
+def generate_instance_id(class_id: str, date_ymd: str, hhmm: str) -> str:
+    """Generate a unique instance ID from preformatted date (YYYYMMDD) and time (HHMM)."""
+    return f"instance_{INSTANCE_PREFIX[class_id]}_{date_ymd}_{hhmm}"
+
+def generate_booking_id(member_id: str, class_id: str, date_ymd: str) -> str:
+    """Generate a unique booking ID from a preformatted date (YYYYMMDD)."""
+    return f"booking_{member_id}_{BOOKING_PREFIX[class_id]}_{date_ymd}"
+
+def build_daily_schedule() -> dict:
     """
-    Generate realistic booking patterns.
+    Resolve WEEKLY_SCHEDULE against gym_classes once.
+    Returns {day_of_week: [(class_id, hour, minute, instructor, capacity, location_name,
+    address, future_rate, rate_boost, hhmm, clock), ...]}, dropping unknown class IDs.
+    future_rate is the entry's (low, high) booking rate once it's upcoming, rate_boost
+    its popularity bonus, hhmm the ID time suffix and clock the timestamp suffix.
+    """
+    daily_schedule = {}
+    for day_of_week, schedule in WEEKLY_SCHEDULE.items():
+        entries = []
+        is_weekend = day_of_week >= 5
+        for class_id, hour, minute, instructor in schedule:
+            if class_id not in gym_classes:
+                continue
+            gym_class = gym_classes[class_id]
+            if is_weekend:
+                future_rate = WEEKEND_BOOKING_RATE
+            elif hour < 10:
+                future_rate = MORNING_BOOKING_RATE
+            else:
+                future_rate = DEFAULT_BOOKING_RATE
+            entries.append((
+                class_id, hour, minute, instructor,
+                gym_class.get("capacity", 20),
+                gym_class.get("locationName", "Class Studio + Spa"),
+                gym_class.get("address", "389 Court St"),
+                future_rate,
+                POPULAR_RATE_BOOST if class_id in BOBBY_FAVORITES else 0.0,  # rate_boost
+                f"{hour:02d}{minute:02d}",  # hhmm
+                f"T{hour:02d}:{minute:02d}:00-05:00",  # clock
+            ))
+        daily_schedule[day_of_week] = entries
+    return daily_schedule
+
+def get_booking_pattern(capacity: int, rate_range: tuple, rate_boost: float) -> tuple:
+    """
+    Generate realistic booking patterns from a precomputed (low, high) rate range.
     Returns (booked_count, waitlist_count)
     """
-    capacity = gym_class.get("capacity", 20)
-    is_past = dt < datetime.now()
-    is_weekend = dt.weekday() >= 5
-    is_morning = dt.hour < 10
-    is_popular = class_id in BOBBY_FAVORITES
-
-    # Base booking rate
-    if is_past:
-        # Past classes were attended
-        base_rate = random.uniform(0.6, 0.95)
-    elif is_weekend:
-        base_rate = random.uniform(0.5, 0.85)
-    elif is_morning:
-        base_rate = random.uniform(0.4, 0.8)
-    else:
-        base_rate = random.uniform(0.3, 0.7)
-
-    if is_popular:
-        base_rate = min(1.0, base_rate + 0.15)
+    low, high = rate_range
+    base_rate = min(1.0, low + (high - low) * _random() + rate_boost)
 
     booked = int(capacity * base_rate)
 
@@ -149,58 +188,77 @@ def get_booking_pattern(dt: datetime, class_id: str, gym_class: dict) -> tuple:
     waitlist = 0
     if booked >= capacity:
         booked = capacity
-        if random.random() < 0.3:
-            waitlist = random.randint(1, 4)
+        if _random() < 0.3:
+            waitlist = 1 + int(_random() * 4)  # 1-4
 
     return booked, waitlist
 
-def should_bobby_book(dt: datetime, class_id: str, day_classes: list) -> bool:
+def should_bobby_book(class_id: str, day_classes: list) -> bool:
     """
     Determine if Bobby should book this class.
     Bobby books ~2-3 classes per week, preferring his favorites.
     """
     is_favorite = class_id in BOBBY_FAVORITES
-    is_past = dt < datetime.now()
 
     # Past: Bobby attended ~2.5 classes/week on average
     # Future: Bobby has some upcoming bookings
 
     # Simple heuristic: book favorites more, ~25% chance for favorites
     if is_favorite:
-        return random.random() < 0.25
+        return _random() < 0.25
     else:
-        return random.random() < 0.08
+        return _random() < 0.08
 
 def generate_class_instances():
-    """Generate all class instances from Oct 2025 through Dec 2025."""
-    instances = {}
-    bookings = {}
+    """
+    Generate all class instances from Oct 2025 through Dec 2025.
+    Returns (instances, bookings, instances_per_month)
+    """
+    # Collect (id, record) pairs and build each dict once at the end
+    instance_list = []
+    booking_list = []
+    months = Counter()  # "YYYY-MM" -> number of instances
 
     # Date range: Oct 1, 2025 to Dec 31, 2025
     start_date = datetime(2025, 10, 1)
     end_date = datetime(2025, 12, 31)
     now = datetime.now()
+    today = now.date()
 
-    current_date = start_date
-    bobby_weekly_bookings = {}  # Track Bobby's bookings per week
+    bobby_weekly_bookings = {}  # Track Bobby's bookings per week (keyed by week_idx)
+    daily_schedule = build_daily_schedule()
 
-    while current_date <= end_date:
-        day_of_week = current_date.weekday()
-        schedule = WEEKLY_SCHEDULE.get(day_of_week, [])
-        week_key = current_date.strftime("%Y-W%W")
+    for day_ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        current_date = date.fromordinal(day_ordinal)
+        # Ordinal 1 (0001-01-01) is a Monday, so this gives Monday-based week numbers
+        week_idx, day_of_week = divmod(day_ordinal - 1, 7)
+        schedule = daily_schedule.get(day_of_week, [])
 
         day_classes = []
 
-        for class_id, hour, minute, instructor in schedule:
-            if class_id not in gym_classes:
-                continue
-
-            gym_class = gym_classes[class_id]
-            dt = current_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            instance_id = generate_instance_id(class_id, dt)
-
-            booked_count, waitlist_count = get_booking_pattern(dt, class_id, gym_class)
-            is_past = dt < now
+        # Format the date once per day; IDs and timestamps are assembled from it
+        iso_date = current_date.isoformat()
+        date_ymd = iso_date.replace("-", "")
+        y, m, d = current_date.year, current_date.month, current_date.day
+        # Whole days before/after today are entirely past/future; only today
+        # needs a per-class comparison against now (day_is_past = None)
+        if current_date < today:
+            day_is_past = True
+        elif current_date > today:
+            day_is_past = False
+        else:
+            day_is_past = None
+        if schedule:
+            months[iso_date[:7]] += len(schedule)
+
+        for (class_id, hour, minute, instructor, capacity, location_name, address,
+             future_rate, rate_boost, hhmm, clock) in schedule:
+            instance_id = generate_instance_id(class_id, date_ymd, hhmm)
+            scheduled_date = iso_date + clock
+            is_past = day_is_past if day_is_past is not None else datetime(y, m, d, hour, minute) < now
+
+            rate_range = PAST_BOOKING_RATE if is_past else future_rate
+            booked_count, waitlist_count = get_booking_pattern(capacity, rate_range, rate_boost)
 
             status = "completed" if is_past else "scheduled"
 
@@ -208,33 +266,34 @@ def generate_class_instances():
                 "id": instance_id,
                 "gymClassId": class_id,
                 "gymId": "district_brooklyn",
-                "scheduledDate": dt.strftime("%Y-%m-%dT%H:%M:%S-05:00"),
+                "scheduledDate": scheduled_date,
                 "instructorId": instructor,
-                "locationName": gym_class.get("locationName", "Class Studio + Spa"),
-                "capacity": gym_class.get("capacity", 20),
+                "locationName": location_name,
+                "capacity": capacity,
                 "bookedCount": booked_count,
                 "waitlistCount": waitlist_count,
                 "status": status,
-                "address": gym_class.get("address", "389 Court St")
+                "address": address
             }
 
-            instances[instance_id] = instance
-            day_classes.append((instance_id, class_id, dt))
+            instance_list.append((instance_id, instance))
+            day_classes.append((instance_id, class_id, is_past, scheduled_date, clock))
 
-        # Generate Bobby's bookings for this day
-        bobby_week_count = bobby_weekly_bookings.get(week_key, 0)
+        # Generate Bobby's bookings for this day (at most one per day)
+        bobby_week_count = bobby_weekly_bookings.get(week_idx, 0)
+        if bobby_week_count >= 3:
+            # Bobby books 2-3 classes per week; the cap for this week is already reached
+            continue
 
-        for instance_id, class_id, dt in day_classes:
-            # Bobby books 2-3 classes per week
-            if bobby_week_count >= 3:
-                break
+        for instance_id, class_id, is_past, scheduled_date, clock in day_classes:
+            if should_bobby_book(class_id, day_classes):
+                booking_id = generate_booking_id("bobby", class_id, date_ymd)
 
-            if should_bobby_book(dt, class_id, day_classes):
-                is_past = dt < now
-                booking_id = generate_booking_id("bobby", class_id, dt)
+                # Booking source varies: 1 in 4 through the AI assistant
+                source = "ai" if _random() < 0.25 else "app"
 
-                # Booking source varies
-                source = random.choice(["app", "app", "app", "ai"])
+                # Booked 1-7 days ahead, at the class's clock time
+                booked_at = date.fromordinal(day_ordinal - 1 - int(_random() * 7)).isoformat() + clock
 
                 booking = {
                     "id": booking_id,
@@ -245,33 +304,43 @@ def generate_class_instances():
                     "status": "attended" if is_past else "confirmed",  # v112.2: Use 'attended' not 'completed'
                     "waitlistPosition": None,
                     "creditUsed": 1,
-                    "bookedAt": (dt - timedelta(days=random.randint(1, 7))).strftime("%Y-%m-%dT%H:%M:%S-05:00"),
+                    "bookedAt": booked_at,
                     "cancelledAt": None,
-                    "checkedInAt": dt.strftime("%Y-%m-%dT%H:%M:%S-05:00") if is_past else None,
+                    "checkedInAt": scheduled_date if is_past else None,
                     "bookingSource": source
                 }
 
-                bookings[booking_id] = booking
-                bobby_week_count += 1
-                bobby_weekly_bookings[week_key] = bobby_week_count
+                booking_list.append((booking_id, booking))
+                bobby_weekly_bookings[week_idx] = bobby_week_count + 1
+                break
 
-        current_date += timedelta(days=1)
+    return dict(instance_list), dict(booking_list), months
 
-    return instances, bookings
+def write_json(path: Path, data, pretty: bool = False) -> None:
+    """
+    Write data as JSON in one write, using orjson when it's installed.
+    Compact by default; pretty=True indents with 2 spaces.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        encoded = json.dumps(data, indent=2).encode()
+    else:
+        encoded = json.dumps(data, separators=(",", ":")).encode()
+    path.write_bytes(encoded)
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate class instance and booking data.")
+    parser.add_argument("--pretty", action="store_true",
+                        help="write 2-space indented JSON instead of compact output")
+    args = parser.parse_args()
+
     print("Generating class instances...")
-    instances, bookings = generate_class_instances()
+    instances, bookings, months = generate_class_instances()
 
     print(f"Generated {len(instances)} class instances")
     print(f"Generated {len(bookings)} Bobby bookings")
 
-    # Count by month
-    months = {}
-    for inst in instances.values():
-        month = inst["scheduledDate"][:7]
-        months[month] = months.get(month, 0) + 1
-
     print("\nInstances by month:")
     for month in sorted(months.keys()):
         print(f"  {month}: {months[month]} classes")
@@ -282,12 +351,10 @@ def main():
     print(f"\nBobby's bookings: {past_bookings} past, {future_bookings} upcoming")
 
     # Save to files
-    with open(OUTPUT_INSTANCES_PATH, "w") as f:
-        json.dump(instances, f, indent=2)
+    write_json(OUTPUT_INSTANCES_PATH, instances, pretty=args.pretty)
     print(f"\nSaved instances to {OUTPUT_INSTANCES_PATH}")
 
-    with open(OUTPUT_BOOKINGS_PATH, "w") as f:
-        json.dump(bookings, f, indent=2)
+    write_json(OUTPUT_BOOKINGS_PATH, bookings, pretty=args.pretty)
     print(f"Saved bookings to {OUTPUT_BOOKINGS_PATH}")
 
 if __name__ == "__main__":